@@ -4,10 +4,12 @@
 from subprocess import Popen
 from pathlib import Path
 import socket
+import time
 import sys
 
 from .parse import register_arguments, RootNs, SearchNs, StartNs, LoginNs, LogoutNs
-from .util import format_locale_date, format_time, format_number, anonymize_email
+from .util import format_locale_date, format_time, format_number, anonymize_email, \
+    filter_libraries
 from .output import Output, HumanOutput, MachineOutput, OutputTable
 from .lang import get as _, lang
 
@@ -25,7 +27,6 @@ from portablemc.standard import Context, Version, VersionManifest, SimpleWatcher
     LoggerFoundEvent, \
     StreamRunner, XmlStreamEvent
 
-from portablemc.fabric import FabricVersion, FabricResolveEvent
 from portablemc.forge import ForgeVersion, ForgeResolveEvent, ForgePostProcessingEvent, \
     ForgePostProcessedEvent, ForgeInstallError
 
@@ -65,26 +66,23 @@ def main(args: Optional[List[str]] = None):
     # Setup common objects in the namespace.
     ns.out = get_output(ns.out_kind)
     ns.context = Context(ns.main_dir, ns.work_dir)
-    ns.version_manifest = VersionManifest(ns.context.work_dir / MANIFEST_CACHE_FILE_NAME)
     ns.auth_database = AuthDatabase(ns.context.work_dir / AUTH_DATABASE_FILE_NAME)
     socket.setdefaulttimeout(ns.timeout)
 
-    # Find the command handler and run it.
-    command_handlers = get_command_handlers()
+    # Walk down the tree of handlers, each level of subcommand is stored in an attribute
+    # prefixed by its parent subcommand, like 'show_subcommand'.
+    handler: Union[None, CommandHandler, CommandTree] = get_command_handlers()
     command_attr = "subcommand"
-    while True:
+    while isinstance(handler, dict):
         command = getattr(ns, command_attr)
-        handler = command_handlers.get(command)
-        if handler is None:
-            parser.print_help()
-            sys.exit(EXIT_FAILURE)
-        elif callable(handler):
-            cmd(handler, ns)
-        elif isinstance(handler, dict):
-            command_attr = f"{command}_{command_attr}"
-            command_handlers = handler
-            continue
-        sys.exit(EXIT_OK)
+        handler = handler.get(command)
+        command_attr = f"{command}_{command_attr}"
+    
+    if handler is None:
+        parser.print_help()
+        sys.exit(EXIT_FAILURE)
+
+    cmd(handler, ns)
 
 
 def get_output(kind: str) -> Output:
@@ -168,6 +166,7 @@ def cmd(handler: CommandHandler, ns: RootNs):
 
 
 def cmd_search(ns: SearchNs):
+    ns.version_manifest = VersionManifest(ns.context.work_dir / MANIFEST_CACHE_FILE_NAME)
     table = ns.out.table()
     cmd_search_handler(ns, ns.kind, table)
     table.print()
@@ -194,9 +193,16 @@ def cmd_search_handler(ns: SearchNs, kind: str, table: OutputTable):
         else:
             alias = False
 
-        for version_data in ns.version_manifest.all_versions():
+        # An alias resolves to an exact version, so we can directly get it.
+        if alias:
+            alias_data = ns.version_manifest.get_version(search)
+            versions_data = [] if alias_data is None else [alias_data]
+        else:
+            versions_data = ns.version_manifest.all_versions()
+
+        for version_data in versions_data:
             version_id = version_data["id"]
-            if search is None or (alias and search == version_id) or (not alias and search in version_id):
+            if search is None or alias or search in version_id:
                 version = ns.context.get_version(version_id)
                 table.add(
                     version_data["type"], 
@@ -291,20 +297,11 @@ def cmd_start(ns: StartNs):
     if ns.exclude_lib is not None:
 
         exclude_filters = ns.exclude_lib
-        def filter_libraries(libs: Dict[LibrarySpecifier, Any]) -> None:
-            # Here the complexity is terrible, but I guess it's acceptable?
-            to_del = []
-            unused_filters = set(exclude_filters)
-            for spec in libs.keys():
-                for spec_filter in exclude_filters:
-                    if spec_filter.matches(spec):
-                        unused_filters.remove(spec_filter)
-                        to_del.append(spec)
-                        break
-            # Finally delete selected specifiers
-            for spec in to_del:
-                del libs[spec]
-                if ns.verbose >= 1:
+
+        def exclude_libraries(libs: Dict[LibrarySpecifier, Any]) -> None:
+            excluded, unused_filters = filter_libraries(libs, exclude_filters)
+            if ns.verbose >= 1:
+                for spec in excluded:
                     ns.out.task("INFO", "start.libraries.excluded", spec=str(spec))
                     ns.out.finish()
             # Inform the user of unused filters
@@ -312,7 +309,7 @@ def cmd_start(ns: StartNs):
                 ns.out.task("WARN", "start.libraries.unused_filter", filter=str(unused_filter))
                 ns.out.finish()
         
-        version.libraries_filters.append(filter_libraries)
+        version.libraries_filters.append(exclude_libraries)
 
     try:
 
@@ -348,38 +345,17 @@ def cmd_start(ns: StartNs):
 
         sys.exit(EXIT_OK)
     
-    except VersionNotFoundError as error:
-        ns.out.task("FAILED", "start.version.not_found", version=error.version)
-        ns.out.finish()
-    
-    except TooMuchParentsError as error:
-        ns.out.task("FAILED", "start.version.too_much_parents")
-        ns.out.finish()
-        ns.out.task(None, "echo", echo=", ".join(error.versions))
-        ns.out.finish()
-
-    except JarNotFoundError as error:
-        ns.out.task("FAILED", "start.jar.not_found")
-        ns.out.finish()
-
-    except JvmNotFoundError as error:
-        ns.out.task("FAILED", f"start.jvm.not_found_error.{error.code}")
-        ns.out.finish()
-    
-    except LibraryNotFoundError as error:
-        ns.out.task("FAILED", f"start.libraries.not_found_error", spec=str(error.lib))
-        ns.out.finish()
-    
-    except ForgeInstallError as error:
-        ns.out.task("FAILED", f"start.forge.install_error.{error.code}")
-        ns.out.finish()
-
-    except DownloadError as error:
-        ns.out.task("FAILED", None)
-        ns.out.finish()
-        for entry, code, _origin in error.errors:
-            ns.out.task(None, "download.error", name=entry.url, message=_(f"download.error.{code}"))
-            ns.out.finish()
+    except Exception as error:
+        # Find the handler of the error's class or its closest parent class.
+        error_handlers = get_start_error_handlers()
+        for error_class in type(error).__mro__:
+            error_handler = error_handlers.get(error_class)
+            if error_handler is not None:
+                error_handler(ns, error)
+                ns.out.finish()
+                break
+        else:
+            raise
     
     sys.exit(EXIT_FAILURE)
 
@@ -402,6 +378,7 @@ def cmd_start_handler(ns: StartNs, kind: str, parts: List[str]) -> Optional[Vers
     elif kind in ("fabric", "quilt"):
         if len(parts) > 2:
             return None
+        from ..fabric import FabricVersion
         constructor = FabricVersion.with_fabric if kind == "fabric" else FabricVersion.with_quilt
         prefix = ns.fabric_prefix if kind == "fabric" else ns.quilt_prefix
         return constructor(parts[0] or "release", parts[1] if len(parts) == 2 else None, context=ns.context, prefix=prefix)
@@ -415,6 +392,39 @@ def cmd_start_handler(ns: StartNs, kind: str, parts: List[str]) -> Optional[Vers
         return None
 
 
+def get_start_error_handlers() -> Dict[type, Callable[[StartNs, Any], None]]:
+    """Internal function returns the handlers for each error that can be raised when 
+    installing a version with the start command, they print the error on output. The
+    last task of a handler is left unfinished, it's finished by the caller.
+    """
+
+    return {
+        VersionNotFoundError: lambda ns, e: ns.out.task("FAILED", "start.version.not_found", version=e.version),
+        TooMuchParentsError: print_too_much_parents_error,
+        JarNotFoundError: lambda ns, e: ns.out.task("FAILED", "start.jar.not_found"),
+        JvmNotFoundError: lambda ns, e: ns.out.task("FAILED", f"start.jvm.not_found_error.{e.code}"),
+        LibraryNotFoundError: lambda ns, e: ns.out.task("FAILED", "start.libraries.not_found_error", spec=str(e.lib)),
+        ForgeInstallError: lambda ns, e: ns.out.task("FAILED", f"start.forge.install_error.{e.code}"),
+        DownloadError: print_download_error,
+    }
+
+def print_too_much_parents_error(ns: StartNs, error: TooMuchParentsError) -> None:
+    ns.out.task("FAILED", "start.version.too_much_parents")
+    ns.out.finish()
+    ns.out.task(None, "echo", echo=", ".join(error.versions))
+
+def print_download_error(ns: StartNs, error: DownloadError) -> None:
+    ns.out.task("FAILED", None)
+    # Many entries usually fail with the same code, translate each code only once.
+    messages: Dict[str, str] = {}
+    for entry, code, _origin in error.errors:
+        message = messages.get(code)
+        if message is None:
+            message = messages[code] = _(f"download.error.{code}")
+        ns.out.finish()
+        ns.out.task(None, "download.error", name=entry.url, message=message)
+
+
 def cmd_login(ns: LoginNs):
     session = prompt_authenticate(ns, ns.email_or_username, True, ns.auth_service)
     sys.exit(EXIT_FAILURE if session is None else EXIT_OK)
@@ -671,8 +681,12 @@ def prompt_microsoft_authenticate(ns: RootNs, email: str) -> Optional[MicrosoftA
     
 class StartWatcher(SimpleWatcher):
 
+    __slots__ = "ns", "out_task", "entries_count", "total_count", "total_size", "speeds", "sizes", "size", "progress_time"
+
     def __init__(self, ns: RootNs) -> None:
 
+        from ..fabric import FabricResolveEvent
+
         def progress_task(key: str, **kwargs) -> None:
             ns.out.task("..", key, **kwargs)
 
@@ -732,11 +746,14 @@ class StartWatcher(SimpleWatcher):
         })
             
         self.ns = ns
+        self.out_task = ns.out.task  # Bound method, used when download progresses.
         self.entries_count: int
+        self.total_count: str
         self.total_size: int
         self.speeds: List[float]
         self.sizes: List[int]
         self.size = 0
+        self.progress_time = 0.0
 
     def download_start(self, e: DownloadStartEvent):
 
@@ -745,29 +762,38 @@ class StartWatcher(SimpleWatcher):
             self.ns.out.finish()
 
         self.entries_count = e.entries_count
+        self.total_count = str(e.entries_count)
         self.total_size = e.size
         self.speeds = [0.0] * e.threads_count
         self.sizes = [0] * e.threads_count
         self.size = 0
+        self.progress_time = 0.0
         self.ns.out.task("..", "download.start")
 
     def download_progress(self, e: DownloadProgressEvent) -> None:
 
         self.speeds[e.thread_id] = e.speed
-        self.sizes[e.thread_id] = e.size
-
-        speed = sum(self.speeds)
-        total_count = str(self.entries_count)
-        count = f"{e.count:{len(total_count)}}"
-        
-        self.ns.out.task("..", "download.progress", 
-            count=count,
-            total_count=total_count,
-            size=f"{format_number(self.size + sum(self.sizes))}o",
-            speed=f"{format_number(speed)}o/s")
 
         if e.done:
+            self.sizes[e.thread_id] = 0
             self.size += e.size
+        else:
+            self.sizes[e.thread_id] = e.size
+
+        # Progress events can come really fast, so we only update the task every 50 ms,
+        # but always update it for the last entry.
+        now = time.monotonic()
+        if now - self.progress_time < 0.05 and e.count != self.entries_count:
+            return
+        
+        self.progress_time = now
+
+        total_count = self.total_count
+        self.out_task("..", "download.progress", 
+            count=str(e.count).rjust(len(total_count)),
+            total_count=total_count,
+            size=format_number(self.size + sum(self.sizes)) + "o",
+            speed=format_number(sum(self.speeds)) + "o/s")
 
     def download_complete(self, e: DownloadCompleteEvent) -> None:
         self.ns.out.task("OK", None)
@@ -9,7 +9,7 @@ from .util import LibrarySpecifierFilter
 from .output import Output
 from .lang import get as _
 
-from typing import Optional, Type, Tuple, List
+from typing import Optional, Type, Tuple, List, Callable
 
 
 # The following classes are only used for type checking and represent a typed namespace
@@ -24,12 +24,13 @@ class RootNs:
     # Initialized by main function after argument parsing.
     out: Output
     context: Context
-    version_manifest: VersionManifest
     auth_database: AuthDatabase
 
 class SearchNs(RootNs):
     kind: str
     input: str
+    # Initialized by the command handler.
+    version_manifest: VersionManifest
 
 class StartNs(RootNs):
     dry: bool
@@ -65,6 +66,24 @@ class LogoutNs(RootNs):
     email_or_username: str
 
 
+class LazyArgumentParser(ArgumentParser):
+    """An argument parser that defers the registration of its arguments until it is
+    actually used for parsing. This is used for subcommands, so only the subcommand that
+    is selected on the command line get its arguments registered.
+    """
+
+    def __init__(self, *args, register: Optional[Callable[[ArgumentParser], None]] = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._lazy_register = register
+
+    def parse_known_args(self, args=None, namespace=None):
+        if self._lazy_register is not None:
+            register = self._lazy_register
+            self._lazy_register = None
+            register(self)
+        return super().parse_known_args(args, namespace)
+
+
 def register_common_help(parser: ArgumentParser) -> None:
     parser.formatter_class = new_help_formatter_class(40)
     parser.add_argument("-h", "--help", action="help", default=SUPPRESS, help=_("args.common.help"))
@@ -82,17 +101,18 @@ def register_arguments() -> ArgumentParser:
     parser.add_argument("--timeout", help=_("args.timeout"), type=float)
     parser.add_argument("--output", help=_("args.output"), dest="out_kind", choices=get_outputs(), default="human-color" if sys.stdout.isatty() else "human")
     parser.add_argument("-v", dest="verbose", help=_("args.verbose"), action="count", default=0)
-    register_subcommands(parser.add_subparsers(title="subcommands", dest="subcommand"))
+    register_subcommands(parser.add_subparsers(title="subcommands", dest="subcommand", parser_class=LazyArgumentParser))
     return parser
 
 
 def register_subcommands(subparsers) -> None:
-    register_search_arguments(subparsers.add_parser("search", help=_("args.search"), add_help=False))
-    register_start_arguments(subparsers.add_parser("start", help=_("args.start"), add_help=False))
-    register_login_arguments(subparsers.add_parser("login", help=_("args.login"), add_help=False))
-    register_logout_arguments(subparsers.add_parser("logout", help=_("args.logout"), add_help=False))
-    register_show_arguments(subparsers.add_parser("show", help=_("args.show"), add_help=False))
-    # register_addon_arguments(subparsers.add_parser("addon", help=_("args.addon")))
+    # Arguments of each subcommand are registered only if the subcommand is parsed.
+    subparsers.add_parser("search", help=_("args.search"), add_help=False, register=register_search_arguments)
+    subparsers.add_parser("start", help=_("args.start"), add_help=False, register=register_start_arguments)
+    subparsers.add_parser("login", help=_("args.login"), add_help=False, register=register_login_arguments)
+    subparsers.add_parser("logout", help=_("args.logout"), add_help=False, register=register_logout_arguments)
+    subparsers.add_parser("show", help=_("args.show"), add_help=False, register=register_show_arguments)
+    # subparsers.add_parser("addon", help=_("args.addon"), register=register_addon_arguments)
 
 
 def register_search_arguments(parser: ArgumentParser) -> None:
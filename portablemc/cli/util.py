@@ -5,7 +5,7 @@ from datetime import datetime
 
 from portablemc.util import LibrarySpecifier, from_iso_date
 
-from typing import Optional, Union
+from typing import Optional, Union, Dict, List, Tuple, Any
 
 
 def format_locale_date(raw: Union[str, float]) -> str:
@@ -96,4 +96,31 @@ class LibrarySpecifierFilter:
         return f"{self.artifact}:{self.version or ''}" + ("" if self.classifier is None else f":{self.classifier}")
 
     def __repr__(self) -> str:
-        return f"<LibrarySpecifierFilter {self}>"
\ No newline at end of file
+        return f"<LibrarySpecifierFilter {self}>"
+
+
+def filter_libraries(libs: Dict[LibrarySpecifier, Any], filters: List[LibrarySpecifierFilter]) -> Tuple[List[LibrarySpecifier], List[LibrarySpecifierFilter]]:
+    """Remove from the given libraries all specifiers matched by at least one filter, a 
+    filter may match multiple libraries.
+
+    :return: A tuple with the removed specifiers and the filters that matched nothing.
+    """
+
+    # Filters are indexed by artifact because they can only match on their artifact.
+    filters_index: Dict[str, List[LibrarySpecifierFilter]] = {}
+    for spec_filter in filters:
+        filters_index.setdefault(spec_filter.artifact, []).append(spec_filter)
+
+    removed = []
+    used_filters = set()
+    for spec in libs.keys():
+        for spec_filter in filters_index.get(spec.artifact, ()):
+            if spec_filter.matches(spec):
+                used_filters.add(spec_filter)
+                removed.append(spec)
+                break
+    
+    for spec in removed:
+        del libs[spec]
+    
+    return removed, [spec_filter for spec_filter in filters if spec_filter not in used_filters]
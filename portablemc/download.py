@@ -2,7 +2,7 @@
 """
 
 from http.client import HTTPConnection, HTTPSConnection, HTTPException
-from queue import Queue, Empty
+from queue import Queue
 from threading import Thread
 from pathlib import Path
 import urllib.parse
@@ -1,11 +1,11 @@
 """Definition of tasks for installing and running Fabric/Quilt mod loader.
 """
 
-from portablemc.standard import VersionHandle, Watcher
 from .standard import Context, VersionHandle, Version, Watcher, VersionNotFoundError
 from .http import http_request, HttpError
 
-from typing import Optional, Any, Iterator
+from typing import Optional, Any, Iterator, Dict, Tuple
+import time
 
 
 class FabricApi:
@@ -14,9 +14,15 @@ class FabricApi:
     for both mod loaders.
     """
 
+    __slots__ = "name", "api_url", "_loader_versions"
+
+    # Duration in seconds for which a requested latest loader version is cached.
+    LOADER_VERSION_TTL = 600.0
+
     def __init__(self, name: str, api_url: str) -> None:
         self.name = name
         self.api_url = api_url
+        self._loader_versions: Dict[str, Tuple[str, float]] = {}
     
     def request_fabric_meta(self, method: str) -> Any:
         """Generic HTTP request to the fabric's REST API.
@@ -24,8 +30,26 @@ class FabricApi:
         return http_request("GET", f"{self.api_url}{method}", accept="application/json").json()
 
     def request_fabric_loader_version(self, vanilla_version: str) -> Optional[str]:
+        """Request the latest loader version for the given vanilla version, the result is
+        cached for `LOADER_VERSION_TTL` seconds, so further calls in this interval will
+        not request the API.
+        """
+        now = time.monotonic()
+        cached = self._loader_versions.get(vanilla_version)
+        if cached is not None and now - cached[1] < self.LOADER_VERSION_TTL:
+            return cached[0]
         loaders = self.request_fabric_meta(f"versions/loader/{vanilla_version}")
-        return loaders[0].get("loader", {}).get("version") if len(loaders) else None
+        loader_version = loaders[0].get("loader", {}).get("version") if len(loaders) else None
+        if loader_version is not None:
+            self._loader_versions[vanilla_version] = (loader_version, now)
+        else:
+            self._loader_versions.pop(vanilla_version, None)
+        return loader_version
+
+    def clear_loader_versions(self) -> None:
+        """Clear the cache of latest loader versions.
+        """
+        self._loader_versions.clear()
 
     def request_version_loader_profile(self, vanilla_version: str, loader_version: str) -> dict:
         return self.request_fabric_meta(f"versions/loader/{vanilla_version}/{loader_version}/profile/json")
@@ -79,7 +103,9 @@ class FabricVersion(Version):
         # Resolve loader version if not specified.
         if self.loader_version is None:
 
-            watcher.handle(FabricResolveEvent(self.api, self.vanilla_version, None))
+            # The same event is triggered again once the loader version is resolved.
+            event = FabricResolveEvent(self.api, self.vanilla_version, None)
+            watcher.handle(event)
 
             try:
                 self.loader_version = self.api.request_fabric_loader_version(self.vanilla_version)
@@ -92,7 +118,8 @@ class FabricVersion(Version):
                 # Correct error if the error is just a not found.
                 raise VersionNotFoundError(f"{self.prefix}-{self.vanilla_version}-???")
 
-            watcher.handle(FabricResolveEvent(self.api, self.vanilla_version, self.loader_version))
+            event.loader_version = self.loader_version
+            watcher.handle(event)
         
         # Finally define the full version id.
         self.version = f"{self.prefix}-{self.vanilla_version}-{self.loader_version}"
@@ -123,7 +150,9 @@ class FabricVersion(Version):
 
 
 class FabricResolveEvent:
-    """Event triggered when the loader version is missing and is being resolved.
+    """Event triggered when the loader version is missing and is being resolved, the
+    loader version is none in such case. The same event instance is triggered again with
+    the loader version once it has been resolved.
     """
     __slots__ = "api", "vanilla_version", "loader_version"
     def __init__(self, api: FabricApi, vanilla_version: str, loader_version: Optional[str]) -> None:
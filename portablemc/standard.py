@@ -66,10 +66,15 @@ class Context:
     def list_versions(self) -> "Iterator[VersionHandle]":
         """List installed versions given their handles.
         """
-        if self.versions_dir.is_dir():
-            for version_dir in self.versions_dir.iterdir():
-                if version_dir.is_dir():
-                    version = VersionHandle(version_dir.name, version_dir)
+        try:
+            versions_entries = os.scandir(self.versions_dir)
+        except (FileNotFoundError, NotADirectoryError):
+            return  # The versions directory doesn't exist.
+        # Using scandir because its entries usually know their type without a stat call.
+        with versions_entries:
+            for version_entry in versions_entries:
+                if version_entry.is_dir():
+                    version = VersionHandle(version_entry.name, self.versions_dir / version_entry.name)
                     if version.metadata_exists():
                         yield version
     
@@ -84,6 +89,8 @@ class Context:
 class Watcher:
     """Base class for a watcher of the install process.
     """
+
+    __slots__ = tuple()
     
     def handle(self, event: Any) -> None:
         """Called when the watcher can handle the given event. Default implementation
@@ -958,17 +965,25 @@ class Version:
 
         watcher.handle(DownloadStartEvent(threads_count, entries_count, self._dl.size))
 
-        for result_count, result in self._dl.download(threads_count, partial_progress=True):
-            if isinstance(result, DownloadResultProgress):
-                watcher.handle(DownloadProgressEvent(
-                    result.thread_id,
-                    result_count,
-                    result.entry,
-                    result.size,
-                    result.speed,
-                    result.done
-                ))
-            elif isinstance(result, DownloadResultError):
+        # If the watcher doesn't override the default handle method, it ignores all
+        # events, so we avoid creating progress events for each progress update.
+        progress = type(watcher).handle is not Watcher.handle
+
+        # Results are of concrete classes, so we can compare them directly, it's faster
+        # than isinstance for this loop that runs for each progress update.
+        for result_count, result in self._dl.download(threads_count, partial_progress=progress):
+            result_class = result.__class__
+            if result_class is DownloadResultProgress:
+                if progress:
+                    watcher.handle(DownloadProgressEvent(
+                        result.thread_id,
+                        result_count,
+                        result.entry,
+                        result.size,
+                        result.speed,
+                        result.done
+                    ))
+            elif result_class is DownloadResultError:
                 errors.append((result.entry, result.code, result.origin))
 
         # If errors are present, raise an error.
@@ -1189,18 +1204,29 @@ class WatcherGroup(Watcher):
     all tasks.
     """
 
+    __slots__ = "children",
+
     def __init__(self) -> None:
-        self.children: Set[Watcher] = set()
+        # Using a tuple because it's faster to iterate, watchers are added only once.
+        self.children: Tuple[Watcher, ...] = ()
     
     def add(self, watcher: Watcher) -> None:
-        """Add a watcher to the installer to this group.
+        """Add a watcher to the installer to this group. Adding the same watcher multiple
+        times has no effect.
         """
-        self.children.add(watcher)
+        if watcher not in self.children:
+            self.children = (*self.children, watcher)
     
     def remove(self, watcher: Watcher) -> None:
         """Remove a watcher from the group.
+
+        :raises KeyError: If the watcher is not in this group.
         """
-        self.children.remove(watcher)
+        try:
+            index = self.children.index(watcher)
+        except ValueError:
+            raise KeyError(watcher) from None
+        self.children = self.children[:index] + self.children[index + 1:]
     
     def handle(self, event: Any) -> None:
         for watcher in self.children:
@@ -1208,11 +1234,13 @@ class WatcherGroup(Watcher):
 
 class SimpleWatcher(Watcher):
 
+    __slots__ = "handlers",
+
     def __init__(self, handlers: Dict[type, Callable[[Any], None]]) -> None:
         self.handlers = handlers
 
     def handle(self, event: Any) -> None:
-        handler = self.handlers.get(type(event))
+        handler = self.handlers.get(event.__class__)
         if handler is not None:
             handler(event)
 
@@ -1390,6 +1418,9 @@ class VersionManifest:
     def __init__(self, cache_file: Optional[Path] = None) -> None:
         self.data: Optional[dict] = None
         self.cache_file = cache_file
+        # Index of versions by id, and the data it was built from.
+        self._versions: Dict[str, dict] = {}
+        self._versions_data: Optional[dict] = None
 
     def _ensure_data(self) -> dict:
         """Internal method that ensure that the manifest data is up-to-date.
@@ -1464,10 +1495,11 @@ class VersionManifest:
         :raises HttpError: Underlying HTTP error if manifest could not be requested.
         """
         version, _alias = self.filter_latest(version)
-        for version_data in self._ensure_data()["versions"]:
-            if version_data["id"] == version:
-                return version_data
-        return None
+        data = self._ensure_data()
+        if self._versions_data is not data:
+            self._versions = {version_data["id"]: version_data for version_data in data["versions"]}
+            self._versions_data = data
+        return self._versions.get(version)
 
     def all_versions(self) -> list:
         return self._ensure_data()["versions"]
@@ -30,3 +30,12 @@ def tmp_context(tmp_path_factory):
 
     from portablemc.standard import Context
     return Context(tmp_path_factory.mktemp("context"))
+
+@pytest.fixture(scope = "session")
+def tmp_manifest(tmp_context):
+    """This fixture is used to share a single version manifest, cached in the
+    session's context, between all tests of the session.
+    """
+
+    from portablemc.standard import VersionManifest
+    return VersionManifest(tmp_context.work_dir / "version_manifest.json")
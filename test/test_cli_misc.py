@@ -42,6 +42,24 @@ def test_register_arguments():
     # Ensure that the arguments registering successfully works.
     register_arguments()
 
+    # Subcommands' arguments are lazily registered when parsed.
+    ns = register_arguments().parse_args(["start", "--dry", "-u", "foo", "1.20.1"])
+    assert ns.subcommand == "start"
+    assert ns.dry and ns.username == "foo" and ns.version == "1.20.1"
+
+    ns = register_arguments().parse_args(["show", "about"])
+    assert ns.subcommand == "show" and ns.show_subcommand == "about"
+
+    # Lazy registration must not shadow argparse's own register method.
+    from argparse import _SubParsersAction
+    parser = register_arguments()
+    subparsers = next(a for a in parser._actions if isinstance(a, _SubParsersAction))
+    start_parser = subparsers.choices["start"]
+    assert callable(start_parser.register)
+    parser.parse_args(["start", "1.20.1"])
+    assert callable(start_parser.register)
+    start_parser.register("type", "test", int)
+
 
 def test_library_specifier_filter():
     
@@ -78,3 +96,24 @@ def test_library_specifier_filter():
     assert not LibrarySpecifierFilter("baz", "0.2.0", "natives-windows-x86").matches(spec_classified)
     assert not LibrarySpecifierFilter("baz", "0.1.0", "windows").matches(spec)
     assert not LibrarySpecifierFilter("baz", "0.1.0", "windows").matches(spec_classified)
+
+
+def test_filter_libraries():
+
+    from portablemc.cli.util import LibrarySpecifierFilter, filter_libraries
+    from portablemc.util import LibrarySpecifier
+
+    spec = LibrarySpecifier("org.lwjgl", "lwjgl", "3.3.1", None)
+    spec_natives = LibrarySpecifier("org.lwjgl", "lwjgl", "3.3.1", "natives-linux")
+    spec_other = LibrarySpecifier("org.lwjgl", "lwjgl-glfw", "3.3.1", None)
+    libs = {spec: 1, spec_natives: 2, spec_other: 3}
+
+    # A single filter matching both classes and natives libraries.
+    lwjgl_filter = LibrarySpecifierFilter("lwjgl", None, None)
+    unused_filter = LibrarySpecifierFilter("lwjgl", "2.9.4", None)
+    nomatch_filter = LibrarySpecifierFilter("nomatch", None, None)
+
+    excluded, unused_filters = filter_libraries(libs, [lwjgl_filter, unused_filter, nomatch_filter])
+    assert excluded == [spec, spec_natives]
+    assert unused_filters == [unused_filter, nomatch_filter]
+    assert libs == {spec_other: 3}
@@ -88,3 +88,105 @@ def test_library_specifier():
     assert spec.extension == "txt"
     assert str(spec) == "foo.bar:baz:0.1.0:classifier@txt"
     assert spec.file_path() == "foo/bar/baz/0.1.0/baz-0.1.0-classifier.txt"
+
+
+def test_fabric_loader_version_cache():
+
+    from portablemc.fabric import FabricApi
+
+    class TestApi(FabricApi):
+        __slots__ = "requests", "loaders"
+        def request_fabric_meta(self, method: str):
+            self.requests += 1
+            return self.loaders
+
+    api = TestApi("test", "")
+    api.requests = 0
+
+    # Empty results are not cached.
+    api.loaders = []
+    assert api.request_fabric_loader_version("1.20.1") is None
+    assert api.request_fabric_loader_version("1.20.1") is None
+    assert api.requests == 2
+
+    # Successful results are cached.
+    api.loaders = [{"loader": {"version": "0.14.21"}}]
+    assert api.request_fabric_loader_version("1.20.1") == "0.14.21"
+    api.loaders = [{"loader": {"version": "0.14.22"}}]
+    assert api.request_fabric_loader_version("1.20.1") == "0.14.21"
+    assert api.requests == 3
+
+    # Clearing the cache requests the API again.
+    api.clear_loader_versions()
+    assert api.request_fabric_loader_version("1.20.1") == "0.14.22"
+    assert api.requests == 4
+
+    # Expired results are requested again.
+    TestApi.LOADER_VERSION_TTL = 0.0
+    api.loaders = [{"loader": {"version": "0.14.23"}}]
+    assert api.request_fabric_loader_version("1.20.1") == "0.14.23"
+    assert api.requests == 5
+
+
+def test_manifest_versions_index():
+
+    from portablemc.standard import VersionManifest
+
+    manifest = VersionManifest()
+    manifest.data = {
+        "latest": {"release": "1.20.1", "snapshot": "23w31a"},
+        "versions": [
+            {"id": "23w31a", "type": "snapshot"},
+            {"id": "1.20.1", "type": "release"},
+        ]
+    }
+
+    assert manifest.get_version("1.20.1") == {"id": "1.20.1", "type": "release"}
+    assert manifest.get_version("release") == {"id": "1.20.1", "type": "release"}
+    assert manifest.get_version("snapshot") == {"id": "23w31a", "type": "snapshot"}
+    assert manifest.get_version("unknown") is None
+
+    # The index is rebuilt when the manifest data is replaced.
+    manifest.data = {"latest": {}, "versions": [{"id": "b"}]}
+    assert manifest.get_version("b") == {"id": "b"}
+    assert manifest.get_version("1.20.1") is None
+
+
+def test_watcher_group():
+
+    from portablemc.standard import Watcher, WatcherGroup
+
+    class TestWatcher(Watcher):
+        __slots__ = "events",
+        def __init__(self) -> None:
+            self.events = []
+        def handle(self, event) -> None:
+            self.events.append(event)
+
+    first, second = TestWatcher(), TestWatcher()
+    group = WatcherGroup()
+    group.add(first)
+    group.add(second)
+    group.add(first)  # Duplicates are ignored.
+    group.handle("event")
+    assert first.events == ["event"] and second.events == ["event"]
+
+    group.remove(first)
+    group.handle("other")
+    assert first.events == ["event"] and second.events == ["event", "other"]
+
+    with pytest.raises(KeyError):
+        group.remove(first)
+
+    # Watchers are removed using the same equality as when added.
+    class EqualWatcher(TestWatcher):
+        __slots__ = tuple()
+        def __eq__(self, other) -> bool:
+            return isinstance(other, EqualWatcher)
+        def __hash__(self) -> int:
+            return 0
+
+    group = WatcherGroup()
+    group.add(EqualWatcher())
+    group.remove(EqualWatcher())
+    assert group.children == ()